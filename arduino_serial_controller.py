@@ -5,22 +5,36 @@ Communicates with Arduino microcontroller via serial connection
 Sends system status and notifications
 """
 
+import binascii
+import configparser
+import contextlib
+import ctypes
+import fcntl
+import heapq
+import io
 import json
 import logging
 import os
-import re
+import queue
+import select
 import signal
+import struct
 import subprocess
 import sys
 import threading
 import time
-import glob
-from dataclasses import dataclass, field, fields, asdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union
 import serial
 
+try:
+    import orjson  # Optional: several times faster than the json module
+except ImportError:
+    orjson = None
+
 
 # Constants
 DEFAULT_CONFIG_PATH = '/boot/config/plugins/arduino-serial-controller/settings.cfg'
@@ -28,17 +42,42 @@ DEFAULT_LOG_DIR = Path('/var/log/arduino-serial-controller')
 ARDUINO_INIT_DELAY = 2.0
 ARRAY_CHECK_INTERVAL = 10
 MAIN_LOOP_INTERVAL = 1
+SEND_QUEUE_SIZE = 8  # Pending frames kept while the serial link is slow; oldest dropped first
+SERIAL_WRITE_BUFFER_SIZE = 1024  # Fits a JSON status update plus the frames queued alongside it
+SERIAL_READ_MAX_LINE = 4096  # Longest partial line kept from the Arduino before it is discarded
 VERSION = '2025.05.26'
 COMMUNICATION_TIMEOUT = 60  # 60 seconds without Arduino response = comm error
 ARDUINO_HEARTBEAT_INTERVAL = 30  # Send heartbeat every 30 seconds
+STATUS_REFRESH_INTERVAL = 300  # Resend an unchanged status update at least this often (seconds)
+SHUTDOWN_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+ARRAY_EVENT_FALLBACK_INTERVAL = 60  # Safety re-check when var.ini changes are watched
+DISK_SCAN_BASE_INTERVAL = 300  # Seconds between SMART/capacity sweeps while values change
+DISK_SCAN_MAX_INTERVAL = 3600  # Backoff cap while disk values stay the same
+MAX_DISK_SCAN_WORKERS = 16  # Upper bound on concurrent smartctl invocations
+SMART_HEALTH_TTL = 3600  # Seconds a SMART health verdict stays fresh
+SMARTCTL_EXIT_OPEN_FAILED = 0x02  # smartctl exit bit 1: device open failed or, with -n, in standby
+TEMP_SENSOR_REPROBE_INTERVAL = 300  # Seconds before looking for a CPU sensor again after none was found
+UNRAID_VAR_INI = '/var/local/emhttp/var.ini'
+# Unraid mdState values mapped to reported array status; others are passed through lowercased
+UNRAID_ARRAY_STATES = {
+    'STARTED': 'started',
+    'STOPPED': 'stopped',
+    'STARTING': 'transitioning',
+    'STOPPING': 'transitioning',
+}
+PROC_UPTIME_PATH = '/proc/uptime'
+PROC_MOUNTINFO_PATH = '/proc/self/mountinfo'
+PROC_MDSTAT_PATH = '/proc/mdstat'
+SYS_BLOCK_PATH = '/sys/block'
+VIRTUAL_BLOCK_PREFIXES = ('loop', 'ram', 'dm-', 'sr', 'zram', 'md', 'nbd')
 
 # Temperature sensor paths in order of preference
-TEMP_SENSOR_PATHS = [
+TEMP_SENSOR_PATHS = (
     '/sys/class/thermal/thermal_zone0/temp',
     '/sys/class/thermal/thermal_zone1/temp',
     '/sys/class/hwmon/hwmon0/temp1_input',
     '/sys/class/hwmon/hwmon1/temp1_input'
-]
+)
 
 # Disk health priority (worst to best)
 HEALTH_PRIORITY = {
@@ -51,8 +90,101 @@ HEALTH_PRIORITY = {
     'UNKNOWN': 6
 }
 
+# Binary frames: start marker, type id, fixed little-endian payload, CRC-16/CCITT of type and payload
+FRAME_START = b'\xAA\x55'
+FRAME_CRC_FORMAT = struct.Struct('<H')
+BINARY_MESSAGE_FORMATS = {
+    'status_update': (0x01, struct.Struct('<IIbBbIBBbIBB?BBH16s')),
+    'array_status_change': (0x02, struct.Struct('<IBB')),  # ts, previous, current
+    'heartbeat': (0x03, struct.Struct('<I')),  # ts
+}
+ARRAY_STATUS_CODES = {'unknown': 0, 'started': 1, 'stopped': 2, 'transitioning': 3}
+UNSET_I8 = -128  # Marks a missing int8 value in binary frames
+UNSET_U8 = 0xFF  # Marks a missing uint8 value in binary frames
+UNSET_U16 = 0xFFFF  # Marks a missing uint16 value in binary frames
+MESSAGE_FORMATS = ('json', 'binary')
+
+# NVMe admin passthrough, used to read the SMART log without starting smartctl
+NVME_IOCTL_ADMIN_CMD = 0xC0484E41  # _IOWR('N', 0x41, struct nvme_passthru_cmd)
+NVME_ADMIN_GET_LOG_PAGE = 0x02
+NVME_LOG_SMART = 0x02
+NVME_SMART_LOG_SIZE = 512
+
+# Shared payload for messages sent without data; never mutated
+EMPTY_DATA: Dict[str, Any] = {}
+
+# (epoch second, formatted string) of the last timestamp produced
+_timestamp_cache: Tuple[int, str] = (-1, '')
+
+
+def iso_timestamp() -> str:
+    """Current local time as an ISO 8601 string with second precision"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached = _timestamp_cache
+    if now != cached_second:
+        # Several messages go out in the same second, so format at most once per second
+        cached = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now))
+        _timestamp_cache = (now, cached)
+    return cached
+
+
+def quantize_temperature(value: Optional[float]) -> Optional[int]:
+    """Round a temperature to whole degrees clamped to the int8 range; None stays None"""
+    if value is None:
+        return None
+    return max(-127, min(127, int(round(value))))
+
+
+def encode_frame(message_type: str, *values: Any) -> bytearray:
+    """Pack values into a binary frame using the layout registered for message_type"""
+    type_id, payload_format = BINARY_MESSAGE_FORMATS[message_type]
+    payload_offset = len(FRAME_START) + 1
+    crc_offset = payload_offset + payload_format.size
+    
+    # Build the whole frame in one buffer rather than concatenating its parts
+    frame = bytearray(crc_offset + FRAME_CRC_FORMAT.size)
+    frame[:len(FRAME_START)] = FRAME_START
+    frame[len(FRAME_START)] = type_id
+    payload_format.pack_into(frame, payload_offset, *values)
+    crc = binascii.crc_hqx(memoryview(frame)[len(FRAME_START):crc_offset], 0xFFFF)
+    FRAME_CRC_FORMAT.pack_into(frame, crc_offset, crc)
+    return frame
+
 
-@dataclass
+def encode_binary_message(message_type: str, data: Dict[str, Any]) -> Optional[bytearray]:
+    """Encode an event message as a binary frame, or None if the type is only sent as JSON"""
+    if message_type == 'array_status_change':
+        return encode_frame(message_type, int(time.time()),
+                            ARRAY_STATUS_CODES.get(data.get('previous_status'), 0),
+                            ARRAY_STATUS_CODES.get(data.get('current_status'), 0))
+    if message_type == 'heartbeat':
+        return encode_frame(message_type, int(time.time()))
+    return None
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# Serialized '{"type":...,"timestamp":"' head of the message envelope, per message type
+_envelope_heads: Dict[str, bytes] = {}
+
+
+def encode_envelope(message_type: str, timestamp: str, data: Dict[str, Any]) -> bytes:
+    """Encode {'type', 'timestamp', 'data'} as one JSON line, serializing only data per call"""
+    head = _envelope_heads.get(message_type)
+    if head is None:
+        head = _envelope_heads[message_type] = (
+            b'{"type":' + encode_json(message_type) + b',"timestamp":"')
+    # timestamp is an ISO 8601 string, which never needs JSON escaping
+    return b''.join((head, timestamp.encode('ascii'), b'","data":', encode_json(data), b'}\n'))
+
+
+@dataclass(slots=True)
 class ArduinoMessage:
     """Optimized message structure for Arduino consumption"""
     # System info (short field names for Arduino efficiency)
@@ -82,11 +214,60 @@ class ArduinoMessage:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, handling the 'as_' field name issue"""
-        data = asdict(self)
-        # Rename as_ to as for JSON since Arduino doesn't care about Python keywords
-        if 'as_' in data:
-            data['as'] = data.pop('as_')
-        return data
+        # Built by hand rather than with asdict() to skip its recursive deepcopy;
+        # as_ becomes 'as' since Arduino doesn't care about Python keywords
+        return {
+            'ts': self.ts,
+            'up': self.up,
+            'ct': quantize_temperature(self.ct),
+            'as': self.as_,
+            'd_temp': quantize_temperature(self.d_temp),
+            'd_cap': self.d_cap,
+            'd_health': self.d_health,
+            'd_count': self.d_count,
+            'n_temp': quantize_temperature(self.n_temp),
+            'n_cap': self.n_cap,
+            'n_health': self.n_health,
+            'n_count': self.n_count,
+            'ups_online': self.ups_online,
+            'ups_batt': self.ups_batt,
+            'ups_load': self.ups_load,
+            'ups_runtime': self.ups_runtime,
+            'ups_status': self.ups_status
+        }
+    
+    def content_key(self) -> Tuple[Any, ...]:
+        """Values the Arduino acts on, ignoring ts and up which change on every update"""
+        return (
+            quantize_temperature(self.ct), self.as_,
+            quantize_temperature(self.d_temp), self.d_cap, self.d_health, self.d_count,
+            quantize_temperature(self.n_temp), self.n_cap, self.n_health, self.n_count,
+            self.ups_online, self.ups_batt, self.ups_load, self.ups_runtime, self.ups_status
+        )
+    
+    def pack(self) -> bytearray:
+        """Encode as a binary status_update frame"""
+        ct, d_temp, n_temp = (quantize_temperature(t) for t in (self.ct, self.d_temp, self.n_temp))
+        return encode_frame(
+            'status_update',
+            int(time.time()),  # ts is sent as epoch seconds
+            self.up,
+            UNSET_I8 if ct is None else ct,
+            ARRAY_STATUS_CODES.get(self.as_, 0),
+            UNSET_I8 if d_temp is None else d_temp,
+            self.d_cap,
+            HEALTH_PRIORITY.get(self.d_health, HEALTH_PRIORITY['UNKNOWN']),
+            min(self.d_count, 255),
+            UNSET_I8 if n_temp is None else n_temp,
+            self.n_cap,
+            HEALTH_PRIORITY.get(self.n_health, HEALTH_PRIORITY['UNKNOWN']),
+            min(self.n_count, 255),
+            self.ups_online,
+            UNSET_U8 if self.ups_batt is None else self.ups_batt,
+            UNSET_U8 if self.ups_load is None else self.ups_load,
+            UNSET_U16 if self.ups_runtime is None else min(self.ups_runtime, UNSET_U16 - 1),
+            self.ups_status.encode('ascii', errors='replace')
+        )
     
     @classmethod
     def get_schema_info(cls) -> Dict[str, str]:
@@ -94,13 +275,13 @@ class ArduinoMessage:
         return {
             'ts': 'timestamp (ISO format)',
             'up': 'uptime (seconds)',
-            'ct': 'cpu_temperature (°C, nullable)',
+            'ct': 'cpu_temperature (whole °C, nullable)',
             'as': 'array_status (started/stopped/unknown)',
-            'd_temp': 'max_disk_temperature (°C, nullable)',
+            'd_temp': 'max_disk_temperature (whole °C, nullable)',
             'd_cap': 'total_disk_capacity (GB)',
             'd_health': 'worst_disk_health (PASSED/FAILED/etc)',
             'd_count': 'disk_count',
-            'n_temp': 'max_nvme_temperature (°C, nullable)', 
+            'n_temp': 'max_nvme_temperature (whole °C, nullable)',
             'n_cap': 'total_nvme_capacity (GB)',
             'n_health': 'worst_nvme_health (PASSED/FAILED/etc)',
             'n_count': 'nvme_count',
@@ -112,7 +293,7 @@ class ArduinoMessage:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskInfo:
     """Information about a storage device"""
     device: str
@@ -122,9 +303,18 @@ class DiskInfo:
     is_nvme: bool
 
 
-@dataclass
+@dataclass(slots=True)
+class DiskSummary:
+    """Aggregated information about a group of storage devices"""
+    temperature: Optional[float] = None  # highest temperature
+    capacity_gb: int = 0  # total capacity
+    health: str = 'UNKNOWN'  # worst health
+    count: int = 0
+
+
+@dataclass(frozen=True, slots=True)
 class ArduinoControllerConfig:
-    """Configuration dataclass for Arduino Serial Controller"""
+    """Configuration dataclass for Arduino Serial Controller, immutable once loaded"""
     serial_port: str = '/dev/ttyUSB0'
     baud_rate: int = 115200  # Updated to match Arduino
     update_interval: int = 30  # seconds
@@ -135,6 +325,8 @@ class ArduinoControllerConfig:
     ups_name: str = 'ups'  # NUT UPS name
     enable_disk_monitoring: bool = True
     enable_ups_monitoring: bool = True
+    message_format: str = 'json'  # 'binary' sends status updates as packed frames
+    max_send_batch: int = SEND_QUEUE_SIZE  # Frames written per serial flush
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization"""
@@ -157,12 +349,19 @@ class ArduinoControllerConfig:
         if self.retry_delay < 0:
             raise ValueError("Retry delay cannot be negative")
         
+        if self.max_send_batch <= 0:
+            raise ValueError("Max send batch must be positive")
+        
         valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         if self.log_level.upper() not in valid_log_levels:
             raise ValueError(f"Log level must be one of: {valid_log_levels}")
         
-        # Normalize log level to uppercase
-        self.log_level = self.log_level.upper()
+        # Normalize log level to uppercase; frozen, so bypass __setattr__ during init
+        object.__setattr__(self, 'log_level', self.log_level.upper())
+        
+        object.__setattr__(self, 'message_format', self.message_format.lower())
+        if self.message_format not in MESSAGE_FORMATS:
+            raise ValueError(f"Message format must be one of: {list(MESSAGE_FORMATS)}")
     
     @classmethod
     def from_file(cls, config_file: str) -> 'ArduinoControllerConfig':
@@ -170,112 +369,181 @@ class ArduinoControllerConfig:
         config_data = {}
         
         if os.path.exists(config_file):
+            # settings.cfg is plain key=value lines, so parse it under a synthetic section
+            parser = configparser.ConfigParser(interpolation=None, strict=False)
             try:
                 with open(config_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if '=' in line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # Convert values to appropriate types
-                            config_data[key] = cls._convert_value(key, value)
+                    # Indented lines would otherwise be glued onto the previous value as continuations
+                    content = ''.join(line.lstrip() for line in f)
+                try:
+                    parser.read_string('[settings]\n' + content, source=config_file)
+                except configparser.ParsingError as e:
+                    # Raised after the whole file is read, so every valid line is still loaded
+                    logging.warning(f"Ignoring malformed lines in {config_file}: {e}")
+                
+                section = parser['settings']
+                for config_field in fields(cls):
+                    if config_field.name in section:
+                        value = cls._convert_value(section, config_field.name, config_field.type)
+                        if value is not None:
+                            config_data[config_field.name] = value
                             
-            except Exception as e:
+            except (OSError, configparser.Error) as e:
                 logging.error(f"Error loading config from {config_file}: {e}")
                 
         return cls(**config_data)
     
     @staticmethod
-    def _convert_value(key: str, value: str) -> Any:
-        """Convert string value to appropriate type based on field"""
-        # Get the expected type from dataclass fields
-        field_types = {f.name: f.type for f in fields(ArduinoControllerConfig)}
-        expected_type = field_types.get(key)
+    def _convert_value(section: configparser.SectionProxy, key: str, expected_type: type) -> Any:
+        """Read key from section as expected_type, returning None if the value is invalid"""
+        getter = {
+            int: section.getint,
+            float: section.getfloat,
+            bool: section.getboolean,
+        }.get(expected_type)
+        if getter is None:
+            return section[key]
         
-        if expected_type == int:
-            try:
-                return int(value)
-            except ValueError:
-                logging.warning(f"Invalid integer value for {key}: {value}")
-                return value
-        elif expected_type == float:
-            try:
-                return float(value)
-            except ValueError:
-                logging.warning(f"Invalid float value for {key}: {value}")
-                return value
-        elif expected_type == bool:
-            return value.lower() in ('true', '1', 'yes', 'on')
-        
-        return value
+        try:
+            return getter(key)
+        except ValueError:
+            logging.warning(f"Invalid {expected_type.__name__} value for {key}: {section[key]}, using default")
+            return None
 
 
 class SystemMonitor:
     """System monitoring utilities"""
-    
-    @staticmethod
-    def get_cpu_temperature() -> Optional[float]:
+
+    # Resolved CPU temperature sensor, kept open across reads
+    _temp_sensor_path: Optional[str] = None
+    _temp_sensor_fd: Optional[int] = None
+    _temp_sensor_divisor: int = 1
+    _temp_sensor_reprobe_at: float = 0.0  # Monotonic time before which a failed probe is not repeated
+    _uptime_fd: Optional[int] = None
+    _mdstat_fd: Optional[int] = None
+
+    @classmethod
+    def get_cpu_temperature(cls) -> Optional[float]:
         """Get CPU temperature from system sensors"""
+        if cls._temp_sensor_fd is not None:
+            try:
+                temp = int(os.pread(cls._temp_sensor_fd, 32, 0))
+                return round(temp / cls._temp_sensor_divisor, 1)
+            except (OSError, ValueError) as e:
+                logging.debug("Cached temperature sensor %s failed, re-probing: %s", cls._temp_sensor_path, e)
+                cls._close_temp_sensor()
+        elif time.monotonic() < cls._temp_sensor_reprobe_at:
+            return None
+
+        return cls._probe_cpu_temperature()
+
+    @classmethod
+    def _probe_cpu_temperature(cls) -> Optional[float]:
+        """Find the first working temperature sensor and cache it for later reads"""
         for sensor_path in TEMP_SENSOR_PATHS:
+            fd = None
             try:
-                if os.path.exists(sensor_path):
-                    with open(sensor_path, 'r') as f:
-                        temp = int(f.read().strip())
-                        # Convert millidegrees to degrees if necessary
-                        if temp > 1000:
-                            temp = temp / 1000
-                        return round(temp, 1)
+                fd = os.open(sensor_path, os.O_RDONLY)
+                temp = int(os.pread(fd, 32, 0))
             except (OSError, ValueError) as e:
-                logging.debug(f"Failed to read temperature from {sensor_path}: {e}")
+                logging.debug("Failed to read temperature from %s: %s", sensor_path, e)
+                if fd is not None:
+                    os.close(fd)
                 continue
-        
+
+            # Convert millidegrees to degrees if necessary
+            cls._temp_sensor_divisor = 1000 if temp > 1000 else 1
+            cls._temp_sensor_path = sensor_path
+            cls._temp_sensor_fd = fd
+            return round(temp / cls._temp_sensor_divisor, 1)
+
         logging.warning("No CPU temperature sensors found")
+        cls._temp_sensor_reprobe_at = time.monotonic() + TEMP_SENSOR_REPROBE_INTERVAL
         return None
+
+    @classmethod
+    def _close_temp_sensor(cls) -> None:
+        """Close and forget the cached temperature sensor"""
+        if cls._temp_sensor_fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(cls._temp_sensor_fd)
+        cls._temp_sensor_path = None
+        cls._temp_sensor_fd = None
+        cls._temp_sensor_divisor = 1
     
-    @staticmethod
-    def get_uptime() -> int:
+    @classmethod
+    def get_uptime(cls) -> int:
         """Get system uptime in seconds"""
         try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.read().split()[0])
-                return int(uptime_seconds)
-        except (OSError, ValueError, IndexError) as e:
+            if cls._uptime_fd is None:
+                cls._uptime_fd = os.open(PROC_UPTIME_PATH, os.O_RDONLY)
+            buf = os.pread(cls._uptime_fd, 64, 0)
+            return int(float(buf.partition(b' ')[0]))
+        except (OSError, ValueError) as e:
             logging.error(f"Error reading uptime: {e}")
             return 0
     
     @staticmethod
-    def get_array_status() -> str:
+    def _pread_all(fd: int) -> bytes:
+        """Read a whole file from the start through an already open descriptor"""
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(fd, 4096, offset)
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+            offset += len(chunk)
+    
+    @classmethod
+    def _read_mdstat(cls) -> Optional[bytes]:
+        """Read /proc/mdstat through a descriptor kept open across polls"""
+        try:
+            if cls._mdstat_fd is None:
+                cls._mdstat_fd = os.open(PROC_MDSTAT_PATH, os.O_RDONLY)
+            return cls._pread_all(cls._mdstat_fd)
+        except OSError as e:
+            logging.debug("Could not read %s: %s", PROC_MDSTAT_PATH, e)
+            return None
+    
+    @classmethod
+    def close(cls) -> None:
+        """Close the descriptors cached across polls"""
+        cls._close_temp_sensor()
+        for fd in (cls._uptime_fd, cls._mdstat_fd):
+            if fd is not None:
+                with contextlib.suppress(OSError):
+                    os.close(fd)
+        cls._uptime_fd = None
+        cls._mdstat_fd = None
+    
+    @classmethod
+    def get_array_status(cls) -> str:
         """Get Unraid array status using Unraid-specific methods"""
         try:
             # Method 1: Check Unraid's var.ini file (most reliable)
-            var_ini_path = '/var/local/emhttp/var.ini'
-            if os.path.exists(var_ini_path):
-                with open(var_ini_path, 'r') as f:
-                    for line in f:
-                        if line.startswith('mdState='):
-                            state = line.split('=')[1].strip().strip('"')
-                            # Unraid states: STOPPED, STARTED, STARTING, STOPPING
-                            if state in ['STARTED']:
-                                return 'started'
-                            elif state in ['STOPPED']:
-                                return 'stopped'
-                            elif state in ['STARTING', 'STOPPING']:
-                                return 'transitioning'
-                            else:
-                                return state.lower()
+            try:
+                with open(UNRAID_VAR_INI, 'rb') as f:
+                    var_ini = f.read()
+            except FileNotFoundError:
+                var_ini = b''
             
-            # Method 2: Check if array mount point exists and has mounted drives
-            if os.path.exists('/mnt/user') and os.path.ismount('/mnt/user'):
-                # Check if any drives are mounted under /mnt/disk*
-                import glob
-                mounted_disks = glob.glob('/mnt/disk*')
-                if mounted_disks:
-                    # Check if any of these are actually mounted
-                    for disk_path in mounted_disks:
-                        if os.path.ismount(disk_path):
-                            return 'started'
+            pos = var_ini.find(b'\nmdState=')
+            if pos >= 0 or var_ini.startswith(b'mdState='):
+                # pos is -1 when mdState is the first line, which slices from the start
+                line = var_ini[pos + 1:].partition(b'\n')[0]
+                state = line.partition(b'=')[2].strip().strip(b'"').decode('ascii', errors='replace')
+                return UNRAID_ARRAY_STATES.get(state) or state.lower()
+            
+            # Method 2: Check if the user share and any /mnt/disk* drive are mounted,
+            # using one read of the mount table instead of a stat per path
+            try:
+                with open(PROC_MOUNTINFO_PATH, 'rb') as f:
+                    mountinfo = f.read()
+                if b' /mnt/user ' in mountinfo and b' /mnt/disk' in mountinfo:
+                    return 'started'
+            except OSError as e:
+                logging.debug("Could not read %s: %s", PROC_MOUNTINFO_PATH, e)
             
             # Method 3: Use mdcmd command (Unraid specific)
             try:
@@ -291,71 +559,191 @@ class SystemMonitor:
                 pass  # mdcmd might not be available
             
             # Method 4: Fallback - check /proc/mdstat but with better parsing
-            if os.path.exists('/proc/mdstat'):
-                with open('/proc/mdstat', 'r') as f:
-                    mdstat = f.read()
-                    # Look for active md devices
-                    if 'md' in mdstat and 'active' in mdstat:
-                        return 'started'
+            mdstat = cls._read_mdstat()
+            # Look for active md devices ("md0 : active raid1 ..."); a bare b'active' would also
+            # match "inactive" arrays and the header is never an md line
+            if mdstat is not None and b'\nmd' in mdstat and b' : active ' in mdstat:
+                return 'started'
             
             # If we can't determine status, assume stopped
             return 'stopped'
             
-        except Exception as e:
+        except OSError as e:
             logging.error(f"Error reading Unraid array status: {e}")
             return 'unknown'
 
 
+class FileChangeWatcher:
+    """Wait for a file to be rewritten using Linux inotify"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, name length
+
+    def __init__(self, path: str):
+        """Watch the parent directory of path, since editors and emhttp may replace the file"""
+        self.path = path
+        self.fd: Optional[int] = None
+        directory, name = os.path.split(path)
+        self._name = os.fsencode(name)
+        # Self-pipe so interrupt() can wake a blocked wait() from another thread
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, f'inotify_add_watch failed for {directory}')
+            self.fd = fd
+        except (OSError, AttributeError) as e:
+            logging.debug(f"inotify unavailable for {path}: {e}")
+
+    @property
+    def available(self) -> bool:
+        """Whether change events are being delivered"""
+        return self.fd is not None
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the watched file changes or timeout expires, returning True on change
+
+        Returns False immediately once interrupt() has been called.
+        """
+        watched = [self._wake_r] if self.fd is None else [self._wake_r, self.fd]
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            ready, _, _ = select.select(watched, [], [], remaining)
+            if self._wake_r in ready:
+                return False
+            if ready and self._drain_events():
+                return True
+
+    def interrupt(self) -> None:
+        """Wake any current and future wait() calls"""
+        # A full or closed pipe means waiters are woken either way
+        with contextlib.suppress(OSError):
+            os.write(self._wake_w, b'\0')
+
+    def _drain_events(self) -> bool:
+        """Read all pending events, returning True if any concerned the watched file"""
+        changed = False
+        while True:
+            try:
+                buf = os.read(self.fd, 4096)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+            while offset + self.EVENT_HEADER.size <= len(buf):
+                _, _, _, name_len = self.EVENT_HEADER.unpack_from(buf, offset)
+                offset += self.EVENT_HEADER.size
+                name = buf[offset:offset + name_len].rstrip(b'\0')
+                offset += name_len
+                if name == self._name:
+                    changed = True
+
+    def close(self) -> None:
+        """Stop watching and release the inotify and wake-up descriptors"""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+        if self._wake_r >= 0:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
+
+
+class NvmePassthruCommand(ctypes.Structure):
+    """Linux struct nvme_passthru_cmd (linux/nvme_ioctl.h)"""
+    _fields_ = [
+        ('opcode', ctypes.c_uint8),
+        ('flags', ctypes.c_uint8),
+        ('rsvd1', ctypes.c_uint16),
+        ('nsid', ctypes.c_uint32),
+        ('cdw2', ctypes.c_uint32),
+        ('cdw3', ctypes.c_uint32),
+        ('metadata', ctypes.c_uint64),
+        ('addr', ctypes.c_uint64),
+        ('metadata_len', ctypes.c_uint32),
+        ('data_len', ctypes.c_uint32),
+        ('cdw10', ctypes.c_uint32),
+        ('cdw11', ctypes.c_uint32),
+        ('cdw12', ctypes.c_uint32),
+        ('cdw13', ctypes.c_uint32),
+        ('cdw14', ctypes.c_uint32),
+        ('cdw15', ctypes.c_uint32),
+        ('timeout_ms', ctypes.c_uint32),
+        ('result', ctypes.c_uint32),
+    ]
+
+
 class DiskMonitor:
     """Disk and NVMe monitoring utilities"""
     
+    # Per-device SMART health as (verdict, expires_at on the monotonic clock)
+    _health_cache: Dict[str, Tuple[str, float]] = {}
+    
     @staticmethod
-    def _run_command(cmd: List[str]) -> Optional[str]:
-        """Run a command and return stdout, or None on error"""
+    def _run_json_command(cmd: List[str]) -> Optional[Dict[str, Any]]:
+        """Run a command and return its decoded JSON stdout whatever the exit code, or None on error
+        
+        smartctl sets exit status bits for failing disks while still printing its full report.
+        """
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                logging.debug(f"Command {' '.join(cmd)} failed with code {result.returncode}: {result.stderr}")
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
-            logging.debug(f"Command {' '.join(cmd)} failed: {e}")
-        return None
+            logging.debug("Command %s failed: %s", cmd, e)
+            return None
+        
+        try:
+            data = json.loads(result.stdout)
+        except ValueError as e:
+            logging.debug("Command %s (exit %d) printed no JSON: %s", cmd, result.returncode, e)
+            return None
+        return data if isinstance(data, dict) else None
     
     @classmethod
     def get_all_disks(cls) -> List[DiskInfo]:
         """Get information about all disks"""
         disks = []
+        device_paths = []
         
-        # Get list of block devices
-        lsblk_output = cls._run_command(['lsblk', '-d', '-n', '-o', 'NAME,SIZE,TYPE'])
-        if not lsblk_output:
-            logging.warning("Could not get disk list from lsblk")
+        # Enumerate block devices straight from sysfs
+        try:
+            entries = sorted(entry.name for entry in os.scandir(SYS_BLOCK_PATH))
+        except OSError as e:
+            logging.warning(f"Could not list block devices from {SYS_BLOCK_PATH}: {e}")
             return disks
         
-        for line in lsblk_output.split('\n'):
-            if not line.strip():
+        for device_name in entries:
+            # Skip loop, ram, optical and other virtual devices
+            if device_name.startswith(VIRTUAL_BLOCK_PREFIXES):
                 continue
-                
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-                
-            device_name = parts[0]
-            device_type = parts[2] if len(parts) > 2 else ''
             
-            # Skip non-disk devices
-            if device_type not in ['disk']:
+            # Only physical disks have a backing device link (md, dm, zram etc. do not)
+            if not os.path.exists(f'{SYS_BLOCK_PATH}/{device_name}/device'):
                 continue
             
-            # Skip loop, ram, and other virtual devices
-            if device_name.startswith(('loop', 'ram', 'dm-')):
-                continue
-            
-            device_path = f'/dev/{device_name}'
-            disk_info = cls._get_disk_info(device_path)
-            if disk_info:
-                disks.append(disk_info)
+            device_paths.append(f'/dev/{device_name}')
+        
+        if not device_paths:
+            return disks
+        
+        # smartctl wall time is spent waiting on the drives, so query them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_DISK_SCAN_WORKERS, len(device_paths)),
+                                thread_name_prefix="DiskScan") as executor:
+            for disk_info in executor.map(cls._get_disk_info, device_paths):
+                if disk_info:
+                    disks.append(disk_info)
         
         return disks
     
@@ -381,29 +769,18 @@ class DiskMonitor:
             )
             
         except Exception as e:
-            logging.debug(f"Error getting info for {device_path}: {e}")
+            logging.debug("Error getting info for %s: %s", device_path, e)
             return None
     
     @classmethod
     def _get_disk_capacity(cls, device_path: str) -> int:
         """Get disk capacity in GB"""
-        try:
-            # Try to get size from lsblk
-            output = cls._run_command(['lsblk', '-d', '-n', '-b', '-o', 'SIZE', device_path])
-            if output:
-                size_bytes = int(output)
-                return int(size_bytes / (1024 ** 3))  # Convert to GB
-        except (ValueError, TypeError):
-            pass
-        
-        # Fallback: try to read from /sys/block
         try:
             device_name = os.path.basename(device_path)
-            with open(f'/sys/block/{device_name}/size', 'r') as f:
-                sectors = int(f.read().strip())
-                # Assume 512 byte sectors
-                size_bytes = sectors * 512
-                return int(size_bytes / (1024 ** 3))
+            with open(f'{SYS_BLOCK_PATH}/{device_name}/size', 'rb') as f:
+                # sysfs always reports the size in 512 byte sectors
+                size_bytes = int(f.read()) * 512
+                return int(size_bytes / (1024 ** 3))  # Convert to GB
         except (OSError, ValueError):
             pass
         
@@ -412,76 +789,100 @@ class DiskMonitor:
     
     @classmethod
     def _get_smart_info(cls, device_path: str) -> tuple[Optional[float], str]:
-        """Get SMART temperature and health info"""
-        temperature = None
-        health = 'UNKNOWN'
-        
-        # Try smartctl
-        output = cls._run_command(['smartctl', '-A', '-H', device_path])
-        if not output:
-            return temperature, health
-        
-        # Parse health
-        if 'PASSED' in output:
-            health = 'PASSED'
-        elif 'FAILED' in output:
-            health = 'FAILED'
-        elif 'FAILING_NOW' in output:
-            health = 'FAILING_NOW'
-        
-        # Parse temperature - look for common temperature attributes
-        temp_patterns = [
-            r'Temperature_Celsius.*?(\d+)',
-            r'Airflow_Temperature_Cel.*?(\d+)',
-            r'Temperature.*?(\d+)',
-        ]
+        """Get SMART temperature and health info, re-checking health only once its cache entry expired"""
+        now = time.monotonic()
+        health, health_expires = cls._health_cache.get(device_path, ('UNKNOWN', 0.0))
         
-        for pattern in temp_patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                try:
-                    temperature = float(match.group(1))
-                    break
-                except ValueError:
-                    continue
+        # NVMe devices answer a log page read directly, which is far cheaper than smartctl
+        if os.path.basename(device_path).startswith('nvme'):
+            smart_log = cls._read_nvme_smart_log(device_path)
+            if smart_log is not None:
+                temperature, health = smart_log
+                cls._health_cache[device_path] = (health, now + SMART_HEALTH_TTL)
+                return temperature, health
+        
+        # Temperature is read on every scan: the adaptive scan interval already spaces scans
+        # further apart than a temperature reading would stay useful.
+        # -n standby skips drives that are spun down instead of waking them
+        report = cls._run_json_command(['smartctl', '--json=c', '-n', 'standby', '-A', device_path])
+        temperature = cls._parse_smart_temperature(report) if report else None
+        
+        if now >= health_expires:
+            report = cls._run_json_command(['smartctl', '--json=c', '-n', 'standby', '-H', device_path])
+            exit_status = report.get('smartctl', {}).get('exit_status', 0) if report else 0
+            # Skipped for standby (or not openable): keep the last verdict and retry next scan
+            if not exit_status & SMARTCTL_EXIT_OPEN_FAILED:
+                # Failing disks set other exit bits but still report smart_status.passed
+                health = cls._parse_smart_health(report) if report else 'UNKNOWN'
+                # Only a definite verdict is cached; UNKNOWN replaces any stale one and is retried
+                expires = now + SMART_HEALTH_TTL if health != 'UNKNOWN' else 0.0
+                cls._health_cache[device_path] = (health, expires)
         
         return temperature, health
     
-    @classmethod
-    def aggregate_disk_data(cls, disks: List[DiskInfo]) -> tuple[List[DiskInfo], List[DiskInfo]]:
-        """Separate and return traditional disks and NVMe devices"""
-        traditional_disks = [disk for disk in disks if not disk.is_nvme]
-        nvme_disks = [disk for disk in disks if disk.is_nvme]
+    @staticmethod
+    def _read_nvme_smart_log(device_path: str) -> Optional[Tuple[Optional[float], str]]:
+        """Read temperature and health from the NVMe SMART log page, or None if unsupported"""
+        log = ctypes.create_string_buffer(NVME_SMART_LOG_SIZE)
+        command = NvmePassthruCommand(
+            opcode=NVME_ADMIN_GET_LOG_PAGE,
+            nsid=0xFFFFFFFF,
+            addr=ctypes.addressof(log),
+            data_len=NVME_SMART_LOG_SIZE,
+            cdw10=((NVME_SMART_LOG_SIZE // 4 - 1) << 16) | NVME_LOG_SMART,
+        )
+        
+        try:
+            fd = os.open(device_path, os.O_RDONLY)
+            try:
+                fcntl.ioctl(fd, NVME_IOCTL_ADMIN_CMD, command)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logging.debug("NVMe SMART log ioctl failed for %s, using smartctl: %s", device_path, e)
+            return None
         
-        return traditional_disks, nvme_disks
+        # Byte 0 is the critical warning bitmap, bytes 1-2 the composite temperature in Kelvin
+        critical_warning = log.raw[0]
+        kelvin = int.from_bytes(log.raw[1:3], 'little')
+        temperature = float(kelvin - 273) if kelvin else None
+        return temperature, 'FAILED' if critical_warning else 'PASSED'
     
     @staticmethod
-    def get_worst_health(disks: List[DiskInfo]) -> str:
-        """Get the worst health status from a list of disks"""
-        if not disks:
+    def _parse_smart_health(report: Dict[str, Any]) -> str:
+        """Parse the overall health verdict from a `smartctl --json=c -H` report"""
+        passed = report.get('smart_status', {}).get('passed')
+        if passed is None:
             return 'UNKNOWN'
-        
-        worst_health = 'UNKNOWN'
-        worst_priority = HEALTH_PRIORITY.get(worst_health, 99)
-        
-        for disk in disks:
-            disk_priority = HEALTH_PRIORITY.get(disk.health, 99)
-            if disk_priority < worst_priority:
-                worst_health = disk.health
-                worst_priority = disk_priority
-        
-        return worst_health
+        return 'PASSED' if passed else 'FAILED'
     
     @staticmethod
-    def get_max_temperature(disks: List[DiskInfo]) -> Optional[float]:
-        """Get the maximum temperature from a list of disks"""
-        temperatures = [disk.temperature for disk in disks if disk.temperature is not None]
-        return max(temperatures) if temperatures else None
+    def _parse_smart_temperature(report: Dict[str, Any]) -> Optional[float]:
+        """Parse the drive temperature from a `smartctl --json=c -A` report"""
+        current = report.get('temperature', {}).get('current')
+        if isinstance(current, (int, float)):
+            return float(current)
+        return None
     
     @staticmethod
-    def get_total_capacity(disks: List[DiskInfo]) -> int:
-        """Get total capacity from a list of disks"""
-        return sum(disk.capacity_gb for disk in disks)
+    def summarize(disks: List[DiskInfo]) -> Tuple[DiskSummary, DiskSummary]:
+        """Summarize traditional disks and NVMe devices in a single pass"""
+        traditional, nvme = DiskSummary(), DiskSummary()
+        
+        for disk in disks:
+            summary = nvme if disk.is_nvme else traditional
+            summary.count += 1
+            summary.capacity_gb += disk.capacity_gb
+            
+            if disk.temperature is not None and (summary.temperature is None
+                                                 or disk.temperature > summary.temperature):
+                summary.temperature = disk.temperature
+            
+            # Keep the worst health; unrecognised values never override a known one
+            if HEALTH_PRIORITY.get(disk.health, 99) < HEALTH_PRIORITY[summary.health]:
+                summary.health = disk.health
+        
+        return traditional, nvme
 
 
 class UPSMonitor:
@@ -493,19 +894,19 @@ class UPSMonitor:
         try:
             result = subprocess.run(['upsc', ups_name], capture_output=True, text=True, timeout=10)
             if result.returncode != 0:
-                logging.debug(f"upsc command failed: {result.stderr}")
+                logging.debug("upsc command failed: %s", result.stderr)
                 return {}
             
             ups_data = {}
-            for line in result.stdout.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
                     ups_data[key.strip()] = value.strip()
             
             return ups_data
             
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
-            logging.debug(f"Error running upsc: {e}")
+            logging.debug("Error running upsc: %s", e)
             return {}
     
     @classmethod
@@ -548,7 +949,7 @@ class UPSMonitor:
             }
             
         except (ValueError, KeyError) as e:
-            logging.debug(f"Error parsing UPS data: {e}")
+            logging.debug("Error parsing UPS data: %s", e)
             return {
                 'online': False,
                 'battery_percent': None,
@@ -565,17 +966,41 @@ class ArduinoSerialController:
         """Initialize the Arduino Serial Controller"""
         self.config = ArduinoControllerConfig.from_file(config_file)
         self.serial_connection: Optional[serial.Serial] = None
-        self.running = False
+        self._tx: Optional[io.BufferedWriter] = None
+        # Guards serial_connection/_tx replacement and every write and flush on them; close() is
+        # deliberately left outside it so a write stalled on a wedged device cannot block reconnect
+        self._tx_lock = threading.Lock()
+        self._last_status_key: Optional[Tuple[Any, ...]] = None
+        self._last_status_sent = 0.0
+        self._stop = threading.Event()
+        self._array_watcher: Optional[FileChangeWatcher] = None
+        # Self-pipe that wakes the main loop out of poll() when a stop is requested
+        self._wake_r, self._wake_w = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
         self.shutdown_initiated = False
+        self._stop_signal: Optional[int] = None
         
         # Communication health tracking
         self.last_arduino_response_time = 0
-        self.last_heartbeat_time = 0
+        self._last_heartbeat_sent = float('-inf')
         self.arduino_parse_errors = 0
         self.communication_healthy = False
         
+        # Disk metrics are expensive (smartctl per disk), so they are refreshed on an
+        # interval that backs off while the summary stays the same
+        self._disk_summary: Optional[Tuple[DiskSummary, DiskSummary]] = None
+        self._disk_summary_changed_at = 0.0
+        self._disk_scan_interval = DISK_SCAN_BASE_INTERVAL
+        self._next_disk_scan = 0.0
+        
+        # Latest array status from the scheduled array check as (status, expires_at),
+        # so status updates between checks do not re-read var.ini
+        self._array_status_cache: Tuple[Optional[str], float] = (None, 0.0)
+        self._last_array_status: Optional[str] = None
+        
         # Setup logging
         self.logger = self._setup_logging()
+        # Log level is fixed after setup, so expensive debug-only work can check this flag
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
         
         # Print schema info on startup
         self._log_schema_info()
@@ -583,9 +1008,13 @@ class ArduinoSerialController:
         # Threading for monitoring different events
         self.monitor_threads: List[threading.Thread] = []
         
-        # Signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        # Encoded frames waiting for the serial writer thread
+        self._send_queue: queue.Queue[bytes] = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+        
+        # Signal handlers for graceful shutdown; they only request a stop, so the
+        # shutdown itself (logging, serial writes) always runs from run() on the main thread
+        for signum in SHUTDOWN_SIGNALS:
+            signal.signal(signum, self._signal_handler)
         
         self.logger.info("Arduino Serial Controller initialized")
     
@@ -629,11 +1058,15 @@ class ArduinoSerialController:
         """Establish serial connection with Arduino"""
         for attempt in range(self.config.retry_attempts):
             try:
-                self.serial_connection = serial.Serial(
+                connection = serial.Serial(
                     port=self.config.serial_port,
                     baudrate=self.config.baud_rate,
-                    timeout=self.config.timeout
+                    timeout=self.config.timeout,
+                    write_timeout=self.config.timeout
                 )
+                with self._tx_lock:
+                    self.serial_connection = connection
+                    self._tx = io.BufferedWriter(connection, buffer_size=SERIAL_WRITE_BUFFER_SIZE)
                 self.logger.info(f"Connected to Arduino on {self.config.serial_port}")
                 time.sleep(ARDUINO_INIT_DELAY)  # Give Arduino time to initialize
                 
@@ -641,41 +1074,40 @@ class ArduinoSerialController:
                 self.last_arduino_response_time = time.time()
                 self.communication_healthy = True
                 self.arduino_parse_errors = 0
+                self._last_status_key = None  # A reconnected (possibly reset) Arduino needs a full status
                 
                 return True
                 
             except serial.SerialException as e:
                 self.logger.error(f"Serial connection attempt {attempt + 1} failed: {e}")
-                if attempt < self.config.retry_attempts - 1:
-                    time.sleep(self.config.retry_delay)
-            except Exception as e:
+                if attempt < self.config.retry_attempts - 1 and self._stop.wait(self.config.retry_delay):
+                    break
+            except (OSError, ValueError) as e:
                 self.logger.error(f"Unexpected error during connection attempt {attempt + 1}: {e}")
-                if attempt < self.config.retry_attempts - 1:
-                    time.sleep(self.config.retry_delay)
+                if attempt < self.config.retry_attempts - 1 and self._stop.wait(self.config.retry_delay):
+                    break
         
         return False
     
     def _arduino_serial_reader(self) -> None:
         """Thread function to continuously read from Arduino serial connection"""
-        while self.running and self.serial_connection and self.serial_connection.is_open:
+        connection = self.serial_connection
+        pending = b''
+        while not self._stop.is_set() and connection and connection.is_open:
             try:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline().decode('utf-8', errors='ignore').strip()
+                # Blocks in the kernel until data arrives, the read timeout expires or
+                # shutdown calls cancel_read(); then takes whatever else is already buffered
+                chunk = connection.read(connection.in_waiting or 1)
+                if not chunk:
+                    continue
+                
+                *lines, pending = (pending + chunk).split(b'\n')
+                if len(pending) > SERIAL_READ_MAX_LINE:
+                    pending = b''  # No newline in sight; drop the garbage rather than grow forever
+                for raw_line in lines:
+                    line = raw_line.decode('utf-8', errors='ignore').strip()
                     if line:
-                        # Log Arduino output with clear prefix
-                        self.logger.info(f"[ARDUINO] {line}")
-                        self.last_arduino_response_time = time.time()
-                        
-                        # Check for specific Arduino status messages
-                        if "JSON Error:" in line:
-                            self.arduino_parse_errors += 1
-                            self.logger.warning(f"Arduino JSON parse error detected. Total errors: {self.arduino_parse_errors}")
-                        elif "Connection timeout" in line:
-                            self.logger.warning("Arduino detected connection timeout")
-                        elif "Buffer overflow" in line:
-                            self.logger.error("Arduino buffer overflow detected")
-                            
-                time.sleep(0.1)  # Short sleep to prevent excessive CPU usage
+                        self._handle_arduino_line(line)
                 
             except (serial.SerialException, OSError) as e:
                 self.logger.error(f"Error reading from Arduino: {e}")
@@ -684,50 +1116,144 @@ class ArduinoSerialController:
                 self.logger.error(f"Unexpected error in Arduino reader: {e}")
                 break
     
-    def _send_message(self, message_type: str, data: Optional[Dict[str, Any]] = None) -> bool:
-        """Send message to Arduino with detailed logging"""
+    def _handle_arduino_line(self, line: str) -> None:
+        """Log one line of Arduino output and track the errors it reports"""
+        # Log Arduino output with clear prefix
+        self.logger.info("[ARDUINO] %s", line)
+        self.last_arduino_response_time = time.time()
+        
+        # Check for specific Arduino status messages
+        if "JSON Error:" in line:
+            self.arduino_parse_errors += 1
+            self.logger.warning(f"Arduino JSON parse error detected. Total errors: {self.arduino_parse_errors}")
+        elif "Connection timeout" in line:
+            self.logger.warning("Arduino detected connection timeout")
+        elif "Buffer overflow" in line:
+            self.logger.error("Arduino buffer overflow detected")
+    
+    def _send_message(self, message_type: str, data: Optional[Dict[str, Any]] = None,
+                      frame: Optional[bytes] = None) -> bool:
+        """Send message to Arduino with detailed logging, using a pre-encoded frame if given"""
         if not self.serial_connection or not self.serial_connection.is_open:
             self.logger.warning("Cannot send message: serial connection not available")
             self.communication_healthy = False
             return False
         
         try:
-            message = {
-                'type': message_type,
-                'timestamp': datetime.now().isoformat(),
-                'data': data or {}
-            }
-            
-            json_message = json.dumps(message) + '\n'
-            
-            # Log the data being sent
-            self.logger.info(f"Sending to Arduino - Type: {message_type}")
-            if data:
-                self.logger.debug(f"Data payload: {json.dumps(data, indent=2)}")
+            if frame is None and self.config.message_format == 'binary':
+                frame = encode_binary_message(message_type, data or EMPTY_DATA)
             
-            self.serial_connection.write(json_message.encode('utf-8'))
-            self.serial_connection.flush()
-            
-            # Update heartbeat time
-            self.last_heartbeat_time = time.time()
+            if frame is not None:
+                self.logger.info("Sending to Arduino - Type: %s (binary, %d bytes)", message_type, len(frame))
+            else:
+                frame = encode_envelope(message_type, iso_timestamp(), data or EMPTY_DATA)
+                
+                # Log the data being sent
+                self.logger.info("Sending to Arduino - Type: %s", message_type)
+                if data and self._debug:
+                    self.logger.debug("Data payload: %s", frame.decode('utf-8').rstrip())
             
-            self.logger.debug(f"Successfully sent message: {message_type}")
+            self._enqueue_frame(frame)
             return True
             
-        except (serial.SerialException, OSError) as e:
-            self.logger.error(f"Serial error sending message: {e}")
-            self.communication_healthy = False
-            return False
-        except json.JSONEncodeError as e:
-            self.logger.error(f"JSON encoding error: {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error sending message: {e}")
+        except (TypeError, ValueError, struct.error) as e:
+            self.logger.error(f"Message encoding error: {e}")
             return False
     
+    def _enqueue_frame(self, frame: bytes) -> None:
+        """Queue an encoded frame for the writer thread, dropping the oldest one if full"""
+        while True:
+            try:
+                self._send_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._send_queue.get_nowait()
+                    self.logger.warning("Serial send queue full, dropped oldest message")
+                except queue.Empty:
+                    pass
+    
+    def _write_frames(self, frames: List[bytes]) -> bool:
+        """Write frames through the buffered writer and flush them as one serial transaction"""
+        with self._tx_lock:
+            connection, tx = self.serial_connection, self._tx
+            if not connection or not connection.is_open or tx is None:
+                self.logger.warning("Cannot write message: serial connection not available")
+                self.communication_healthy = False
+                return False
+            
+            try:
+                for frame in frames:
+                    tx.write(frame)
+                # Hand the bytes to the tty driver; no tcdrain, the kernel transmits in the background
+                tx.flush()
+            except (serial.SerialException, OSError, ValueError) as e:
+                self.logger.error(f"Serial error sending message: {e}")
+                self.communication_healthy = False
+                return False
+        
+        if not self.communication_healthy:
+            # Communication was restored
+            self.logger.info("Arduino communication restored")
+            self.communication_healthy = True
+            self.arduino_parse_errors = 0  # Reset error count
+        
+        return True
+    
+    def _take_pending_frames(self, frames: List[bytes], limit: int) -> List[bytes]:
+        """Move queued frames into frames until it holds limit items or the queue is empty"""
+        while len(frames) < limit:
+            try:
+                frames.append(self._send_queue.get_nowait())
+            except queue.Empty:
+                break
+        return frames
+    
+    def _serial_writer(self) -> None:
+        """Thread function to write queued frames so slow serial I/O never delays monitoring"""
+        while not self._stop.is_set():
+            try:
+                frame = self._send_queue.get(timeout=MAIN_LOOP_INTERVAL)
+            except queue.Empty:
+                continue
+            
+            # Frames queued in the same tick (status, array change, heartbeat) share one write
+            try:
+                self._write_frames(self._take_pending_frames([frame], self.config.max_send_batch))
+            except Exception as e:
+                self.logger.error(f"Unexpected error in serial writer: {e}")
+    
+    def _drain_send_queue(self) -> None:
+        """Synchronously write and flush any frames still queued"""
+        while True:
+            frames = self._take_pending_frames([], self.config.max_send_batch)
+            if not frames or not self._write_frames(frames):
+                return
+    
     def _send_arduino_message(self, arduino_msg: ArduinoMessage) -> bool:
         """Send optimized Arduino message"""
-        return self._send_message('status_update', arduino_msg.to_dict())
+        if self.config.message_format != 'binary':
+            return self._send_message('status_update', arduino_msg.to_dict())
+        
+        try:
+            frame = arduino_msg.pack()
+        except struct.error as e:
+            self.logger.error(f"Binary frame encoding error: {e}")
+            return False
+        return self._send_message('status_update', frame=frame)
+    
+    def _send_status_if_changed(self, status: ArduinoMessage) -> None:
+        """Send a status update only if its content changed or a periodic refresh is due"""
+        key = status.content_key()
+        now = time.monotonic()
+        if key == self._last_status_key and now - self._last_status_sent < STATUS_REFRESH_INTERVAL:
+            # Unchanged; the heartbeat keeps the Arduino's communication timeout satisfied
+            self.logger.debug("Status unchanged, skipping update")
+            return
+        
+        if self._send_arduino_message(status):
+            self._last_status_key = key
+            self._last_status_sent = now
     
     def _check_communication_health(self) -> None:
         """Check and update communication health status"""
@@ -755,44 +1281,61 @@ class ArduinoSerialController:
                     'error_count': self.arduino_parse_errors
                 })
         
-        # Send periodic heartbeat if needed
-        if current_time - self.last_heartbeat_time > ARDUINO_HEARTBEAT_INTERVAL:
-            self._send_message('heartbeat', {'timestamp': datetime.now().isoformat()})
+        # Send a heartbeat whenever waiting for the next check would leave more than
+        # ARDUINO_HEARTBEAT_INTERVAL without one; the sketch resets its heartbeat
+        # timeout only on heartbeat messages, not on status updates
+        now = time.monotonic()
+        if now + self.config.update_interval - self._last_heartbeat_sent > ARDUINO_HEARTBEAT_INTERVAL:
+            if self._send_message('heartbeat', {'timestamp': iso_timestamp()}):
+                self._last_heartbeat_sent = now
+    
+    def _get_disk_summary(self) -> Tuple[DiskSummary, DiskSummary]:
+        """Return the cached disk summary, rescanning once the adaptive interval has elapsed"""
+        now = time.monotonic()
+        if self._disk_summary is not None and now < self._next_disk_scan:
+            return self._disk_summary
+        
+        try:
+            summary = DiskMonitor.summarize(DiskMonitor.get_all_disks())
+        except Exception as e:
+            self.logger.error(f"Error collecting disk information: {e}")
+            self._next_disk_scan = now + DISK_SCAN_BASE_INTERVAL
+            return self._disk_summary or (DiskSummary(), DiskSummary())
+        
+        # Back off while nothing changes, return to the base interval as soon as something does
+        if summary == self._disk_summary:
+            self._disk_scan_interval = min(self._disk_scan_interval * 2, DISK_SCAN_MAX_INTERVAL)
+            self.logger.debug("Disk summary unchanged for %ds, next scan in %ds",
+                              now - self._disk_summary_changed_at, self._disk_scan_interval)
+        else:
+            self._disk_scan_interval = DISK_SCAN_BASE_INTERVAL
+            self._disk_summary_changed_at = now
+            self._disk_summary = summary
+        
+        self._next_disk_scan = now + self._disk_scan_interval
+        return summary
+    
+    def _get_array_status(self) -> str:
+        """Return the latest checked array status, reading it directly if that is stale"""
+        status, expires_at = self._array_status_cache
+        if status is not None and time.monotonic() < expires_at:
+            return status
+        return SystemMonitor.get_array_status()
     
     def _get_system_status(self) -> ArduinoMessage:
         """Collect comprehensive system status in optimized format"""
         # Basic system info
         cpu_temp = SystemMonitor.get_cpu_temperature()
         uptime = SystemMonitor.get_uptime()
-        array_status = SystemMonitor.get_array_status()
+        array_status = self._get_array_status()
         
         # Initialize default values
-        disk_temp, disk_cap, disk_health, disk_count = None, 0, 'UNKNOWN', 0
-        nvme_temp, nvme_cap, nvme_health, nvme_count = None, 0, 'UNKNOWN', 0
+        disks, nvme = DiskSummary(), DiskSummary()
         ups_online, ups_batt, ups_load, ups_runtime, ups_status = False, None, None, None, 'UNAVAILABLE'
         
         # Get disk information if enabled
         if self.config.enable_disk_monitoring:
-            try:
-                all_disks = DiskMonitor.get_all_disks()
-                traditional_disks, nvme_disks = DiskMonitor.aggregate_disk_data(all_disks)
-                
-                # Traditional disks
-                if traditional_disks:
-                    disk_temp = DiskMonitor.get_max_temperature(traditional_disks)
-                    disk_cap = DiskMonitor.get_total_capacity(traditional_disks)
-                    disk_health = DiskMonitor.get_worst_health(traditional_disks)
-                    disk_count = len(traditional_disks)
-                
-                # NVMe disks
-                if nvme_disks:
-                    nvme_temp = DiskMonitor.get_max_temperature(nvme_disks)
-                    nvme_cap = DiskMonitor.get_total_capacity(nvme_disks)
-                    nvme_health = DiskMonitor.get_worst_health(nvme_disks)
-                    nvme_count = len(nvme_disks)
-                    
-            except Exception as e:
-                self.logger.error(f"Error collecting disk information: {e}")
+            disks, nvme = self._get_disk_summary()
         
         # Get UPS information if enabled
         if self.config.enable_ups_monitoring:
@@ -803,22 +1346,22 @@ class ArduinoSerialController:
                 ups_load = ups_info['load_percent']
                 ups_runtime = ups_info['runtime_minutes']
                 ups_status = ups_info['status']
-            except Exception as e:
+            except (OSError, KeyError) as e:
                 self.logger.error(f"Error collecting UPS information: {e}")
         
         return ArduinoMessage(
-            ts=datetime.now().isoformat(),
+            ts=iso_timestamp(),
             up=uptime,
             ct=cpu_temp,
             as_=array_status,
-            d_temp=disk_temp,
-            d_cap=disk_cap,
-            d_health=disk_health,
-            d_count=disk_count,
-            n_temp=nvme_temp,
-            n_cap=nvme_cap,
-            n_health=nvme_health,
-            n_count=nvme_count,
+            d_temp=disks.temperature,
+            d_cap=disks.capacity_gb,
+            d_health=disks.health,
+            d_count=disks.count,
+            n_temp=nvme.temperature,
+            n_cap=nvme.capacity_gb,
+            n_health=nvme.health,
+            n_count=nvme.count,
             ups_online=ups_online,
             ups_batt=ups_batt,
             ups_load=ups_load,
@@ -826,55 +1369,108 @@ class ArduinoSerialController:
             ups_status=ups_status
         )
     
-    def _monitor_array_status(self) -> None:
-        """Monitor array status changes"""
-        last_status: Optional[str] = None
+    def _check_array_status(self, recheck_interval: float) -> None:
+        """Read the array status, cache it and notify the Arduino if it changed"""
+        current_status = SystemMonitor.get_array_status()
+        # Valid until the next scheduled re-check, with slack for a slow iteration
+        self._array_status_cache = (
+            current_status, time.monotonic() + recheck_interval + ARRAY_CHECK_INTERVAL)
         
-        while self.running:
-            try:
-                current_status = SystemMonitor.get_array_status()
-                
-                if last_status is not None and current_status != last_status:
-                    self.logger.info(f"Array status changed: {last_status} -> {current_status}")
-                    self._send_message('array_status_change', {
-                        'previous_status': last_status,
-                        'current_status': current_status
-                    })
-                
-                last_status = current_status
-                time.sleep(ARRAY_CHECK_INTERVAL)
-                
-            except Exception as e:
-                self.logger.error(f"Error monitoring array status: {e}")
-                time.sleep(ARRAY_CHECK_INTERVAL)
+        last_status = self._last_array_status
+        if last_status is not None and current_status != last_status:
+            self.logger.info("Array status changed: %s -> %s", last_status, current_status)
+            self._send_message('array_status_change', {
+                'previous_status': last_status,
+                'current_status': current_status
+            })
+        
+        self._last_array_status = current_status
     
-    def _periodic_status_update(self) -> None:
-        """Send periodic status updates to Arduino"""
-        while self.running:
-            try:
-                # Check communication health
-                self._check_communication_health()
-                
-                # Send status update
-                status = self._get_system_status()
-                success = self._send_arduino_message(status)
-                
-                if success and not self.communication_healthy:
-                    # Communication was restored
-                    self.logger.info("Arduino communication restored")
-                    self.communication_healthy = True
-                    self.arduino_parse_errors = 0  # Reset error count
-                
-                time.sleep(self.config.update_interval)
+    def _send_status_update(self) -> None:
+        """Check communication health and send the current status"""
+        self._check_communication_health()
+        self._send_status_if_changed(self._get_system_status())
+    
+    def _run_task(self, name: str, task: Callable[[], None]) -> None:
+        """Run one scheduled task, logging rather than propagating its errors"""
+        try:
+            task()
+        except Exception as e:
+            self.logger.error(f"Error in {name}: {e}")
+    
+    def _monitor_loop(self) -> None:
+        """Thread function running the status update and array check on one deadline heap"""
+        # Wake on var.ini rewrites when inotify is available, otherwise fall back to polling
+        watcher = self._array_watcher = FileChangeWatcher(UNRAID_VAR_INI)
+        if watcher.available:
+            self.logger.info(f"Watching {UNRAID_VAR_INI} for array status changes")
+            array_interval = ARRAY_EVENT_FALLBACK_INTERVAL
+        else:
+            array_interval = ARRAY_CHECK_INTERVAL
+        check_array = partial(self._check_array_status, array_interval)
+        
+        # (deadline, order, name, task, interval); order breaks ties so the array check
+        # runs first and the first status update sees a cached array status
+        now = time.monotonic()
+        schedule = [
+            (now, 0, 'array status check', check_array, array_interval),
+            (now, 1, 'periodic update', self._send_status_update, self.config.update_interval),
+        ]
+        heapq.heapify(schedule)
+        
+        try:
+            while not self._stop.is_set():
+                deadline, order, name, task, interval = schedule[0]
+                now = time.monotonic()
+                if now < deadline:
+                    # Sleep until the next task is due, checking the array early if var.ini changes
+                    if watcher.wait(deadline - now):
+                        self._run_task('array status check', check_array)
+                    continue
                 
-            except Exception as e:
-                self.logger.error(f"Error in periodic update: {e}")
-                time.sleep(self.config.update_interval)
+                # Reschedule before running; skip missed slots rather than bursting to catch up
+                heapq.heapreplace(schedule, (max(deadline + interval, now), order, name, task, interval))
+                self._run_task(name, task)
+        finally:
+            watcher.close()
     
     def _signal_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals"""
-        self.logger.info(f"Received signal {signum}, initiating shutdown...")
-        self.shutdown()
+        # Logged by shutdown(); the handler can run while the main thread is inside a logging call
+        self._stop_signal = signum
+        self._request_stop()
+    
+    def _request_stop(self) -> None:
+        """Stop the main loop and wake every waiting thread"""
+        self._stop.set()
+        if self._array_watcher is not None:
+            self._array_watcher.interrupt()
+        connection = self.serial_connection
+        if connection is not None and connection.is_open:
+            with contextlib.suppress(serial.SerialException, OSError):
+                connection.cancel_read()  # Wake the reader thread out of its blocking read
+        # A full or closed pipe means the main loop is woken either way
+        with contextlib.suppress(OSError):
+            os.write(self._wake_w, b'\0')
+    
+    def _wait_for_port_event(self, timeout: float) -> bool:
+        """Block until the serial port hangs up or errors, a stop is requested or timeout expires
+        
+        Returns True only for a hangup or error on the port.
+        """
+        poller = select.poll()
+        poller.register(self._wake_r, select.POLLIN)
+        connection = self.serial_connection
+        port_fd = connection.fileno() if connection is not None and connection.is_open else None
+        if port_fd is not None:
+            # No input events requested: the reader thread owns the data, and
+            # POLLHUP/POLLERR/POLLNVAL are always reported
+            poller.register(port_fd, 0)
+        
+        for fd, events in poller.poll(timeout * 1000):
+            if fd == port_fd and events & (select.POLLHUP | select.POLLERR | select.POLLNVAL):
+                return True
+        return False
     
     def _is_connection_healthy(self) -> bool:
         """Check if serial connection is healthy"""
@@ -888,13 +1484,15 @@ class ArduinoSerialController:
             return
             
         self.shutdown_initiated = True
+        if self._stop_signal is not None:
+            self.logger.info(f"Received signal {self._stop_signal}, initiating shutdown...")
         self.logger.info("Shutting down Arduino Serial Controller...")
         
         # Send shutdown notification to Arduino
         self._send_message('system_shutdown', {'reason': 'service_stop'})
         
         # Stop the main loop
-        self.running = False
+        self._request_stop()
         
         # Wait for threads to finish
         for thread in self.monitor_threads:
@@ -903,15 +1501,24 @@ class ArduinoSerialController:
                 if thread.is_alive():
                     self.logger.warning(f"Thread {thread.name} did not finish gracefully")
         
+        # Release the /proc and sysfs descriptors kept open between polls
+        SystemMonitor.close()
+        
+        # Write anything the writer thread did not get to, including the shutdown message
+        self._drain_send_queue()
+        
         # Close serial connection
         if self.serial_connection and self.serial_connection.is_open:
             time.sleep(1)  # Give Arduino time to process shutdown message
             try:
+                self.serial_connection.cancel_write()
                 self.serial_connection.close()
                 self.logger.info("Serial connection closed")
-            except Exception as e:
+            except (serial.SerialException, OSError) as e:
                 self.logger.error(f"Error closing serial connection: {e}")
         
+        os.close(self._wake_r)
+        os.close(self._wake_w)
         self.logger.info("Arduino Serial Controller stopped")
     
     def run(self) -> None:
@@ -926,50 +1533,51 @@ class ArduinoSerialController:
         # Send startup notification
         self._send_message('system_startup', {'version': VERSION})
         
-        self.running = True
-        
         # Start monitoring threads
-        status_thread = threading.Thread(
-            target=self._periodic_status_update, 
-            daemon=True, 
-            name="StatusUpdateThread"
-        )
-        array_thread = threading.Thread(
-            target=self._monitor_array_status, 
-            daemon=True, 
-            name="ArrayMonitorThread"
+        monitor_thread = threading.Thread(
+            target=self._monitor_loop,
+            daemon=True,
+            name="MonitorThread"
         )
         arduino_reader_thread = threading.Thread(
             target=self._arduino_serial_reader,
             daemon=True,
             name="ArduinoReaderThread"
         )
+        serial_writer_thread = threading.Thread(
+            target=self._serial_writer,
+            daemon=True,
+            name="SerialWriterThread"
+        )
         
-        self.monitor_threads = [status_thread, array_thread, arduino_reader_thread]
+        self.monitor_threads = [monitor_thread, arduino_reader_thread, serial_writer_thread]
         
-        status_thread.start()
-        array_thread.start()
+        serial_writer_thread.start()
+        monitor_thread.start()
         arduino_reader_thread.start()
         
         self.logger.info("Arduino Serial Controller is running...")
         
         try:
-            # Main loop - keep the service alive
-            while self.running:
-                time.sleep(MAIN_LOOP_INTERVAL)
+            # Main loop - keep the service alive, reacting to port hangups as the kernel reports them
+            while not self._stop.is_set():
+                if self._wait_for_port_event(MAIN_LOOP_INTERVAL):
+                    self.logger.warning("Serial port hung up or reported an error")
+                    self.communication_healthy = False
+                if self._stop.is_set():
+                    break
                 
                 # Reconnect if connection lost
                 if not self._is_connection_healthy():
                     self.logger.warning("Serial connection lost, attempting to reconnect...")
                     if self.serial_connection:
-                        try:
+                        with contextlib.suppress(serial.SerialException, OSError):
+                            self.serial_connection.cancel_write()
                             self.serial_connection.close()
-                        except:
-                            pass
                     
                     if not self._connect_arduino():
                         self.logger.error("Failed to reconnect, will retry...")
-                        time.sleep(self.config.retry_delay)
+                        self._stop.wait(self.config.retry_delay)
                     else:
                         # Restart Arduino reader thread if connection restored
                         for i, thread in enumerate(self.monitor_threads):
@@ -983,8 +1591,6 @@ class ArduinoSerialController:
                                 new_reader_thread.start()
                                 break
                         
-        except KeyboardInterrupt:
-            self.logger.info("Keyboard interrupt received")
         except Exception as e:
             self.logger.error(f"Unexpected error in main loop: {e}")
         finally:
@@ -43,7 +43,7 @@ fi
 
 # Install dependencies directly
 echo "⬇️  Installing dependencies..."
-uv pip install "pyserial>=3.5" "pyinstaller>=5.0"
+uv pip install "pyserial>=3.5" "orjson>=3.9" "pyinstaller>=5.0"
 
 # Create standalone executable
 echo "🏗️  Creating standalone executable..."